@@ -3,6 +3,6 @@
 __version__ = "0.3.2"
 
 from .core import DataDiff
-from .reporter import HtmlReporter
+from .reporter import HtmlReporter, generate_many
 
-__all__ = ["DataDiff", "HtmlReporter"]
+__all__ = ["DataDiff", "HtmlReporter", "generate_many"]
@@ -2,8 +2,16 @@
 #
 # The Python wrapper that exposes the Rust binary.
 
+import io
+import logging
+import operator
+import os
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, reduce
+
 import polars as pl
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from pathlib import Path
 
 # This import assumes the package was built and installed
@@ -11,18 +19,182 @@ try:
     from ._internal import diff_files as _rust_diff_files
 except ImportError:
     # Fallback for development/IDE linting without binary
-    def _rust_diff_files(a, b, k):
+    def _rust_diff_files(a, b, k, return_mismatch_keys=False):
         return {"error": "Rust extension not compiled"}
 
+logger = logging.getLogger(__name__)
+
+# Maximum number of scanned inputs kept per DataDiff instance
+_CACHE_SIZE = 8
+
+
+def _read_json_lazy(path: str, low_memory: bool = False) -> pl.LazyFrame:
+    # Standard JSON doesn't support lazy scanning in Polars yet
+    return pl.read_json(path).lazy()
+
+
+# File extension -> LazyFrame reader; anything else is treated as CSV
+_READERS = {
+    ".parquet": pl.scan_parquet,
+    ".pq": pl.scan_parquet,
+    ".json": _read_json_lazy,
+    ".jsonl": pl.scan_ndjson,
+    ".ndjson": pl.scan_ndjson,
+}
+
+
+def _is_parquet(path: str) -> bool:
+    return _READERS.get(Path(path).suffix.lower()) is pl.scan_parquet
+
+
+def _scan_df(path: str, low_memory: bool = False) -> pl.LazyFrame:
+    """
+    Opens a file as a LazyFrame, dispatching on its extension.
+    low_memory trades scan throughput for a lower peak memory footprint.
+    """
+    reader = _READERS.get(Path(path).suffix.lower(), pl.scan_csv)
+    return reader(path, low_memory=low_memory)
+
+
+# Key dtypes the in-memory hash joins can't handle (only the streaming inner
+# join can), which rules out the semi-join rebuild in get_mismatch_df
+_STREAMING_ONLY_KEY_DTYPES = (pl.List, pl.Array)
+
+
+def _file_signature(path: str) -> tuple:
+    """
+    Identifies a file's contents by (path, mtime, size) for cache lookups.
+    """
+    stat = os.stat(path)
+    return (path, stat.st_mtime_ns, stat.st_size)
+
+
+@lru_cache(maxsize=16)
+def _build_mismatch_plan(names_a: tuple, names_b: tuple, key_columns: tuple) -> tuple:
+    """
+    Returns (shared non-key columns, mismatch mask) for a pair of schemas.
+    The expressions don't reference their inputs, so each schema pair is
+    planned once per process and reused across calls and DataDiff instances.
+    """
+    in_b = set(names_b)
+    nonkey_common = tuple(
+        col_name for col_name in names_a
+        if col_name not in key_columns and col_name in in_b
+    )
+
+    # Null-safe inequality in a single kernel: null vs null counts as equal
+    col_diffs = [
+        pl.col(col_name).ne_missing(pl.col(f"{col_name}_right"))
+        for col_name in nonkey_common
+    ]
+
+    # One fused row-wise reduction instead of a chain of pairwise ORs
+    mask = pl.any_horizontal(col_diffs) if col_diffs else pl.lit(False)
+    return nonkey_common, mask
+
+
+def _parquet_key_ranges(path: str, key_columns: List[str]) -> Dict[str, Optional[tuple]]:
+    """
+    Returns the (min, max) of each key column across all row groups, read from
+    the Parquet footer statistics in one pass. A key maps to None if any row
+    group lacks statistics for it.
+    """
+    import pyarrow.parquet as pq
+
+    metadata = pq.ParquetFile(path).metadata
+    ranges: Dict[str, Optional[tuple]] = {}
+    for key in key_columns:
+        lo = hi = None
+        for i in range(metadata.num_row_groups):
+            row_group = metadata.row_group(i)
+            stats = None
+            for j in range(row_group.num_columns):
+                column = row_group.column(j)
+                if column.path_in_schema == key:
+                    stats = column.statistics
+                    break
+            if stats is None or not stats.has_min_max:
+                lo = hi = None
+                break
+            lo = stats.min if lo is None else min(lo, stats.min)
+            hi = stats.max if hi is None else max(hi, stats.max)
+        ranges[key] = (lo, hi) if lo is not None else None
+    return ranges
+
+
+def _is_range_prunable(dtype: pl.DataType) -> bool:
+    # Footer statistics of these dtypes map onto Python values that order like
+    # the column itself; categoricals and durations don't
+    return (
+        dtype.is_numeric()
+        or (dtype.is_temporal() and dtype != pl.Duration)
+        or dtype == pl.String
+    )
+
+
+def _key_overlap_filter(
+    path_a: str, path_b: str, key_dtypes: Dict[str, pl.DataType]
+) -> Optional[pl.Expr]:
+    """
+    Builds a predicate restricting each key column to the interval where the
+    two Parquet files overlap. Rows outside it can never survive the inner join,
+    and Polars uses the same row-group statistics to skip decoding them.
+    key_dtypes maps each key column to its dtype; keys of other dtypes are
+    left unpruned.
+    """
+    key_columns = [key for key, dtype in key_dtypes.items() if _is_range_prunable(dtype)]
+    if not key_columns:
+        return None
+    try:
+        ranges_a = _parquet_key_ranges(path_a, key_columns)
+        ranges_b = _parquet_key_ranges(path_b, key_columns)
+    except (TypeError, OSError):
+        # Incomparable statistics or unreadable footer
+        return None
+
+    exprs = []
+    for key in key_columns:
+        range_a, range_b = ranges_a[key], ranges_b[key]
+        if range_a is None or range_b is None:
+            continue
+        try:
+            lo, hi = max(range_a[0], range_b[0]), min(range_a[1], range_b[1])
+            if lo > hi:
+                return pl.lit(False)
+        except TypeError:
+            # Incomparable statistics (mismatched dtypes)
+            continue
+        # Bounds are literals (a bare string would be read as a column name),
+        # cast to the column's dtype so e.g. time zones and units line up
+        dtype = key_dtypes[key]
+        exprs.append(pl.col(key).is_between(pl.lit(lo).cast(dtype), pl.lit(hi).cast(dtype)))
+    if not exprs:
+        return None
+    return reduce(operator.and_, exprs)
+
 class DataDiff:
     """
     Main entry point for comparing datasets.
+
+    keep_mismatch_keys makes compare() also collect the keys of modified rows,
+    so a following get_mismatch_df() skips its own key join. It costs an extra
+    engine pass per compare(), so enable it only when mismatches are inspected.
     """
-    def __init__(self, key_columns: List[str]):
+    def __init__(
+        self,
+        key_columns: List[str],
+        low_memory: bool = False,
+        keep_mismatch_keys: bool = False,
+    ):
         self.key_columns = key_columns
+        self.low_memory = low_memory
+        self.keep_mismatch_keys = keep_mismatch_keys
         self.last_result = None
         self.file_a = None
         self.file_b = None
+        self._df_cache: "OrderedDict[tuple, pl.LazyFrame]" = OrderedDict()
+        self._last_compare_key: Optional[tuple] = None
+        self._mismatch_keys: Optional[pl.DataFrame] = None
 
     def compare(self, file_a: str, file_b: str) -> Dict[str, Any]:
         """
@@ -37,13 +209,69 @@ class DataDiff:
         if not Path(self.file_b).exists():
             raise FileNotFoundError(f"File not found: {self.file_b}")
 
+        # Same inputs (unchanged on disk) and keys as last time: reuse the result
+        compare_key = (
+            _file_signature(self.file_a),
+            _file_signature(self.file_b),
+            tuple(self.key_columns),
+        )
+        if self.last_result is not None and compare_key == self._last_compare_key:
+            return self.last_result
+
         # Call Rust!
-        print(f"🐨 Comparing {self.file_a} vs {self.file_b} using Rust engine...")
-        result = _rust_diff_files(self.file_a, self.file_b, self.key_columns)
+        logger.info("Comparing %s vs %s using Rust engine...", self.file_a, self.file_b)
+        result = _rust_diff_files(
+            self.file_a, self.file_b, self.key_columns,
+            return_mismatch_keys=self.keep_mismatch_keys,
+        )
+        # Keys of modified rows, reused by get_mismatch_df instead of re-joining
+        keys_ipc = result.pop("mismatch_keys_ipc", None)
+        self._mismatch_keys = (
+            pl.read_ipc_stream(io.BytesIO(keys_ipc)) if keys_ipc is not None else None
+        )
         self.last_result = result
+        self._last_compare_key = compare_key
         
         return result
 
+    def compare_many(
+        self, pairs: List[Tuple[str, str]], max_workers: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Compares several file pairs concurrently and returns their results in
+        input order. The Rust engine releases the GIL while it scans, so pairs
+        run in parallel. Unlike compare(), this does not update last_result.
+        """
+        pairs = [(str(file_a), str(file_b)) for file_a, file_b in pairs]
+
+        # Validate every path up front so no work starts on a bad batch
+        for path in (path for pair in pairs for path in pair):
+            if not os.path.exists(path):
+                raise FileNotFoundError(f"File not found: {path}")
+
+        logger.info("Comparing %d file pairs using Rust engine...", len(pairs))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(
+                lambda pair: _rust_diff_files(pair[0], pair[1], self.key_columns),
+                pairs,
+            ))
+
+    def _scan_cached(self, path: str) -> pl.LazyFrame:
+        """
+        Returns the LazyFrame for a file, reusing it while the file is unchanged.
+        """
+        signature = _file_signature(path)
+        lf = self._df_cache.get(signature)
+        if lf is not None:
+            self._df_cache.move_to_end(signature)
+            return lf
+
+        lf = _scan_df(path, low_memory=self.low_memory)
+        self._df_cache[signature] = lf
+        if len(self._df_cache) > _CACHE_SIZE:
+            self._df_cache.popitem(last=False)
+        return lf
+
     def get_mismatch_df(self) -> pl.DataFrame:
         """
         Returns a Polars DataFrame containing rows that exist in both files
@@ -52,40 +280,93 @@ class DataDiff:
         if not self.file_a or not self.file_b:
             raise ValueError("No comparison has been run yet.")
             
-        # Scan files lazily
-        def scan_df(path):
-            if path.endswith(".parquet") or path.endswith(".pq"):
-                return pl.scan_parquet(path)
-            if path.endswith(".json"):
-                # Standard JSON doesn't support lazy scanning in Polars yet
-                return pl.read_json(path).lazy()
-            if path.endswith(".jsonl") or path.endswith(".ndjson"):
-                return pl.scan_ndjson(path)
-            return pl.scan_csv(path)
-
-        lf_a = scan_df(self.file_a)
-        lf_b = scan_df(self.file_b)
-
-        # Join on keys
-        inner = lf_a.join(lf_b, on=self.key_columns, suffix="_right")
-        
-        # Build a filter mask for any column difference
-        mask = None
-        for col_name in lf_a.collect_schema().names():
-            if col_name in self.key_columns:
-                continue
-            
-            # Compare values and handle nulls
-            # We use neq_missing equivalent: (a != b) | (a.is_null() != b.is_null())
-            # In modern Polars, we can also use pl.col(col_name).eq_missing(pl.col(f"{col_name}_right")).not_()
-            col_diff = pl.col(col_name).eq_missing(pl.col(f"{col_name}_right")).not_()
-            
-            if mask is None:
-                mask = col_diff
-            else:
-                mask = mask | col_diff
-        
-        if mask is not None:
-            # We collect using streaming to keep memory usage low
-            return inner.filter(mask).collect(streaming=True)
-        return pl.DataFrame(schema=inner.collect_schema())
+        lf_a = self._scan_cached(self.file_a)
+        lf_b = self._scan_cached(self.file_b)
+        keys = self.key_columns
+        schema_a = lf_a.collect_schema()
+        schema_b = lf_b.collect_schema()
+
+        if _is_parquet(self.file_a) and _is_parquet(self.file_b):
+            # Prune row groups whose key ranges cannot overlap the other file;
+            # only keys typed identically on both sides share one predicate
+            key_filter = _key_overlap_filter(self.file_a, self.file_b, {
+                key: schema_a[key]
+                for key in keys
+                if key in schema_a and schema_a.get(key) == schema_b.get(key)
+            })
+            if key_filter is not None:
+                lf_a = lf_a.filter(key_filter)
+                lf_b = lf_b.filter(key_filter)
+        current_key = (
+            _file_signature(self.file_a),
+            _file_signature(self.file_b),
+            tuple(keys),
+        )
+        from_compare = current_key == self._last_compare_key
+
+        # No join kernel hashes Decimal keys correctly: join on their exact text
+        # form (at side A's scale) and restore the dtype on the result
+        decimal_keys = {
+            key: schema_a[key]
+            for key in keys
+            if schema_a.get(key, pl.Null).base_type() == pl.Decimal
+        }
+        decimal_as_text = [
+            pl.col(key).cast(dtype).cast(pl.String) for key, dtype in decimal_keys.items()
+        ]
+        if decimal_keys:
+            lf_a = lf_a.with_columns(decimal_as_text)
+            lf_b = lf_b.with_columns(decimal_as_text)
+
+        if (
+            from_compare and self.last_result.get("sorted") and len(keys) == 1
+            and not decimal_keys
+        ):
+            # compare() verified the key is ascending in both files: let the
+            # joins merge the inputs instead of hashing them
+            lf_a = lf_a.set_sorted(keys[0])
+            lf_b = lf_b.set_sorted(keys[0])
+
+        nonkey_common, mask = _build_mismatch_plan(
+            tuple(schema_a.names()),
+            tuple(schema_b.names()),
+            tuple(keys),
+        )
+
+        if any(
+            dtype is not None and dtype.base_type() in _STREAMING_ONLY_KEY_DTYPES
+            for key in keys
+            for dtype in (schema_a.get(key), schema_b.get(key))
+        ):
+            # Only the streaming engine can join these keys: single pass
+            return (
+                lf_a.join(lf_b, on=keys, suffix="_right")
+                .filter(mask)
+                .collect(streaming=True)
+            )
+
+        if from_compare and self._mismatch_keys is not None:
+            # The Rust engine already found the mismatched keys during compare()
+            mismatch_keys = self._mismatch_keys.lazy().with_columns(decimal_as_text)
+        else:
+            # Pass 1: find mismatched keys using only the compared columns
+            mismatch_keys = (
+                lf_a.select(*keys, *nonkey_common)
+                .join(lf_b.select(*keys, *nonkey_common), on=keys, suffix="_right")
+                .filter(mask)
+                .select(keys)
+            )
+
+        # Pass 2: recover full-width rows for the mismatched keys only
+        rows_a = lf_a.join(mismatch_keys, on=keys, how="semi")
+        rows_b = lf_b.join(mismatch_keys, on=keys, how="semi")
+
+        # Duplicate keys can pair a mismatched key's rows identically, so the
+        # mask runs again on the (already narrowed) final join.
+        # We collect using streaming to keep memory usage low
+        return (
+            rows_a.join(rows_b, on=keys, suffix="_right")
+            .filter(mask)
+            .with_columns(pl.col(key).cast(dtype) for key, dtype in decimal_keys.items())
+            .collect(streaming=True)
+        )
@@ -13,6 +13,7 @@ use pyo3::wrap_pyfunction;
 ///     file_a (str): Path to first file
 ///     file_b (str): Path to second file
 ///     key_cols (list[str]): Columns to join on
+///     return_mismatch_keys (bool): Also return the keys of modified rows
 ///
 /// Returns:
 ///     dict: {
@@ -24,24 +25,34 @@ use pyo3::wrap_pyfunction;
 ///         "modified_cols": list[str],
 ///         "schema_diff": list[dict],  // New!
 ///         "null_counts": dict,        // New! { "col_name": [nulls_in_a, nulls_in_b] }
+///         "sorted": bool,             // Single key, ascending and null-free in both files
+///         "mismatch_keys_ipc": bytes, // Only with return_mismatch_keys (Arrow IPC stream)
 ///     }
 #[pyfunction]
+#[pyo3(signature = (file_a, file_b, _key_cols, return_mismatch_keys=false))]
 fn diff_files<'py>(
     py: Python<'py>,
     file_a: String,
     file_b: String,
     _key_cols: Vec<String>,
+    return_mismatch_keys: bool,
 ) -> PyResult<Bound<'py, PyDict>> {
     // 1. Read files lazily using Polars
+    // Extensions match case-insensitively, like the Python-side _READERS dispatch
     let scan_df = |path: &str| -> PyResult<LazyFrame> {
-        if path.ends_with(".parquet") || path.ends_with(".pq") {
+        let ext = std::path::Path::new(path)
+            .extension()
+            .and_then(|e| e.to_str())
+            .map(|e| e.to_ascii_lowercase())
+            .unwrap_or_default();
+        if ext == "parquet" || ext == "pq" {
             LazyFrame::scan_parquet(path.into(), Default::default())
                 .map_err(|e| PyErr::new::<pyo3::exceptions::PyIOError, _>(e.to_string()))
-        } else if path.ends_with(".jsonl") || path.ends_with(".ndjson") {
+        } else if ext == "jsonl" || ext == "ndjson" {
             LazyJsonLineReader::new(path.into())
                 .finish()
                 .map_err(|e| PyErr::new::<pyo3::exceptions::PyIOError, _>(e.to_string()))
-        } else if path.ends_with(".json") {
+        } else if ext == "json" {
             // Standard JSON doesn't have a native lazy scanner in Polars
             let df = JsonReader::new(
                 std::fs::File::open(path)
@@ -72,19 +83,27 @@ fn diff_files<'py>(
     let keys: Vec<Expr> = _key_cols.iter().map(|s| col(s.as_str())).collect();
     let keys_strs: Vec<&str> = _key_cols.iter().map(|s| s.as_str()).collect();
 
-    // 2.2 Perform the Join (Lazy)
-    let joined_lf = lf_a.clone().join(
-        lf_b.clone(),
-        keys.clone(),
-        keys.clone(),
-        JoinArgs::new(JoinType::Inner).with_suffix(Some("_right".into())),
-    );
+    // 2.1 Project both sides to the shared columns (keys included) before joining,
+    // so columns present in only one file are never carried through the join
+    let common_cols: Vec<Expr> = schema_a
+        .iter_names()
+        .filter(|name| schema_b.contains(name.as_str()))
+        .map(|name| col(name.clone()))
+        .collect();
 
-    // 2.2 Pre-Calculation: Height and Uniqueness (Small passes)
+    // 2.2 Pre-Calculation: Height, Uniqueness and Sortedness (Small passes)
     // We don't use streaming here because these are lightweight and streaming adds overhead for small files
-    let get_meta = |lf: LazyFrame, name: &str, key: &str| -> PyResult<(usize, usize)> {
+    let get_meta = |lf: LazyFrame, name: &str, key: &str| -> PyResult<(usize, usize, bool)> {
+        let is_sorted = col(key)
+            .gt_eq(col(key).shift(lit(1)))
+            .all(true)
+            .and(col(key).is_not_null().all(true));
         let res = lf
-            .select([len().alias("total"), col(key).n_unique().alias("unique")])
+            .select([
+                len().alias("total"),
+                col(key).n_unique().alias("unique"),
+                is_sorted.alias("sorted"),
+            ])
             .collect()
             .map_err(|e| {
                 PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(format!(
@@ -107,6 +126,10 @@ fn diff_files<'py>(
             .unwrap()
             .try_extract::<u32>()
             .unwrap_or(0) as usize;
+        let sorted = matches!(
+            res.column("sorted").unwrap().get(0),
+            Ok(AnyValue::Boolean(true))
+        );
 
         if unique < total && total > 0 {
             println!(
@@ -114,11 +137,23 @@ fn diff_files<'py>(
                 name, unique, total
             );
         }
-        Ok((total, unique))
+        Ok((total, unique, sorted))
     };
 
-    let (height_a, unique_a) = get_meta(lf_a.clone(), "File A", keys_strs[0])?;
-    let (height_b, unique_b) = get_meta(lf_b.clone(), "File B", keys_strs[0])?;
+    // Both files are decoded concurrently; each pass only touches its own input
+    // The GIL is released around every heavy collect so Python threads (compare_many)
+    // can run several comparisons at once
+    let (meta_a, meta_b) = py.detach(|| {
+        std::thread::scope(|s| {
+            let meta_b = s.spawn(|| get_meta(lf_b.clone(), "File B", keys_strs[0]));
+            let meta_a = get_meta(lf_a.clone(), "File A", keys_strs[0]);
+            (meta_a, meta_b.join())
+        })
+    });
+    let (height_a, unique_a, sorted_a) = meta_a?;
+    let (height_b, unique_b, sorted_b) = meta_b.map_err(|_| {
+        PyErr::new::<pyo3::exceptions::PyRuntimeError, _>("Error reading File B: worker panicked")
+    })??;
 
     // 2.2.1 Join Safety Guard (Cartesian Product Estimation)
     // If keys are not unique, the worst case join size is (non-unique_a * non-unique_b)
@@ -141,6 +176,26 @@ fn diff_files<'py>(
         }
     }
 
+    // 2.2.2 Sorted Fast Path
+    // A single ascending, null-free key on both sides lets Polars merge the
+    // inputs instead of building a hash table on one of them
+    let keys_sorted = keys_strs.len() == 1 && sorted_a && sorted_b;
+    let mut left_lf = lf_a.clone().select(common_cols.clone());
+    let mut right_lf = lf_b.clone().select(common_cols);
+    if keys_sorted {
+        let flag = col(keys_strs[0]).set_sorted_flag(IsSorted::Ascending);
+        left_lf = left_lf.with_column(flag.clone());
+        right_lf = right_lf.with_column(flag);
+    }
+
+    // 2.2.3 Perform the Join (Lazy)
+    let joined_lf = left_lf.join(
+        right_lf,
+        keys.clone(),
+        keys.clone(),
+        JoinArgs::new(JoinType::Inner).with_suffix(Some("_right".into())),
+    );
+
     // 2.3 Core Statistics Calculation
 
     // 2.3.1 Build Statistics Query
@@ -156,7 +211,7 @@ fn diff_files<'py>(
         if schema_b.contains(name_str) {
             let right_name = format!("{}_right", name_str);
             let dtype_b = schema_b.get(name_str).unwrap();
-            let is_diff_expr = col(name_str).eq_missing(col(&right_name)).not();
+            let is_diff_expr = col(name_str).neq_missing(col(&right_name));
             aggs.push(
                 is_diff_expr
                     .clone()
@@ -168,27 +223,27 @@ fn diff_files<'py>(
                 Some(m) => Some(m.or(is_diff_expr)),
                 None => Some(is_diff_expr),
             };
+            // null_count reads the validity bitmaps directly instead of
+            // materializing an is_null mask and summing it
             aggs.push(
                 col(name_str)
-                    .is_null()
-                    .cast(DataType::Int32)
-                    .sum()
+                    .null_count()
                     .alias(&format!("{}_null_a", name_str)),
             );
             aggs.push(
                 col(&right_name)
-                    .is_null()
-                    .cast(DataType::Int32)
-                    .sum()
+                    .null_count()
                     .alias(&format!("{}_null_b", name_str)),
             );
             if dtype_a.is_numeric() && dtype_b.is_numeric() {
                 let diff_expr = col(name_str).cast(DataType::Float64)
                     - col(&right_name).cast(DataType::Float64);
-                let abs_diff = when(diff_expr.clone().gt(0.0))
-                    .then(diff_expr.clone())
-                    .otherwise(diff_expr * lit(-1.0));
-                aggs.push(abs_diff.max().alias(&format!("{}_max_diff", name_str)));
+                aggs.push(
+                    diff_expr
+                        .abs()
+                        .max()
+                        .alias(&format!("{}_max_diff", name_str)),
+                );
             }
         }
     }
@@ -203,11 +258,14 @@ fn diff_files<'py>(
     }
 
     // Run the main statistics pass (Streaming is only forced here for big data)
-    let stats_res = joined_lf
-        .clone()
-        .select(aggs)
-        .with_new_streaming(true)
-        .collect()
+    let stats_res = py
+        .detach(|| {
+            joined_lf
+                .clone()
+                .select(aggs)
+                .with_new_streaming(true)
+                .collect()
+        })
         .map_err(|e| PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(e.to_string()))?;
 
     let matched = stats_res
@@ -233,14 +291,37 @@ fn diff_files<'py>(
     let added = height_b.saturating_sub(matched);
     let identical_rows_count = matched.saturating_sub(modified_rows_count);
 
+    // 2.3.2 Mismatch Keys (serialized as an Arrow IPC stream so Python can skip re-joining)
+    let mismatch_keys_ipc = if return_mismatch_keys {
+        let keys_lf = match &total_modified_mask {
+            Some(mask) => joined_lf.clone().filter(mask.clone()).select(keys.clone()),
+            None => joined_lf.clone().select(keys.clone()).limit(0),
+        };
+        let mut keys_df = py
+            .detach(|| keys_lf.with_new_streaming(true).collect())
+            .map_err(|e| PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(e.to_string()))?;
+        let mut buf: Vec<u8> = Vec::new();
+        IpcStreamWriter::new(&mut buf)
+            .finish(&mut keys_df)
+            .map_err(|e| PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(e.to_string()))?;
+        Some(buf)
+    } else {
+        None
+    };
+
     // 2.4 Global Sample Pass (Fetch samples for ALL columns in one pass)
     let global_samples = if let Some(mask) = total_modified_mask {
-        joined_lf
-            .clone()
-            .filter(mask)
-            .limit(100) // Fetch up to 100 modified rows once
-            .collect()
-            .ok()
+        py.detach(|| {
+            joined_lf
+                .clone()
+                .filter(mask)
+                .limit(100) // Fetch up to 100 modified rows once
+                // Streaming lets the scan stop after the first batches that fill the limit
+                // instead of materializing the whole join
+                .with_new_streaming(true)
+                .collect()
+                .ok()
+        })
     } else {
         None
     };
@@ -328,7 +409,8 @@ fn diff_files<'py>(
                                     key_map.push_str(&format!("{}: {} ", k, val));
                                 }
                                 sample_keys.append(key_map.trim())?;
-                                sample_values.append(format!("{} -> {}", val_a, val_b))?;
+                                sample_values
+                                    .append((format!("{}", val_a), format!("{}", val_b)))?;
                                 found_samples += 1;
                                 if found_samples >= 5 {
                                     break;
@@ -356,7 +438,11 @@ fn diff_files<'py>(
     dict.set_item("modified_rows_count", modified_rows_count)?;
     dict.set_item("added", added)?;
     dict.set_item("removed", removed)?;
+    dict.set_item("sorted", keys_sorted)?;
     dict.set_item("column_stats", column_stats)?;
+    if let Some(buf) = mismatch_keys_ipc {
+        dict.set_item("mismatch_keys_ipc", pyo3::types::PyBytes::new(py, &buf))?;
+    }
 
     Ok(dict)
 }
@@ -0,0 +1,253 @@
+import datetime
+import decimal
+import io
+import os
+
+import polars as pl
+import pytest
+
+from koala_diff import DataDiff, core
+from koala_diff.core import _key_overlap_filter, _scan_df
+
+
+def _write_parquet(path, frame: dict) -> str:
+    pl.DataFrame(frame).write_parquet(path)
+    return str(path)
+
+
+@pytest.mark.parametrize(
+    "keys_a, keys_b, dtype",
+    [
+        (["a", "b", "c"], ["b", "c", "d"], pl.String),
+        (
+            [datetime.date(2024, 1, d) for d in (1, 2, 3)],
+            [datetime.date(2024, 1, d) for d in (2, 3, 4)],
+            pl.Date,
+        ),
+        (
+            [datetime.datetime(2024, 1, d, tzinfo=datetime.timezone.utc) for d in (1, 2, 3)],
+            [datetime.datetime(2024, 1, d, tzinfo=datetime.timezone.utc) for d in (2, 3, 4)],
+            pl.Datetime("us", "Europe/Amsterdam"),
+        ),
+        (["a", "b", "c"], ["b", "c", "d"], pl.Categorical),
+        (["a", "b", "c"], ["b", "c", "d"], pl.Enum(["a", "b", "c", "d"])),
+        (
+            [datetime.timedelta(seconds=s) for s in (1, 2, 3)],
+            [datetime.timedelta(seconds=s) for s in (2, 3, 4)],
+            pl.Duration("us"),
+        ),
+    ],
+    ids=["string", "date", "datetime-tz", "categorical", "enum", "duration"],
+)
+def test_mismatch_df_with_non_numeric_parquet_keys(tmp_path, keys_a, keys_b, dtype):
+    file_a = _write_parquet(
+        tmp_path / "a.parquet", {"k": pl.Series(keys_a, dtype=dtype), "v": [1, 2, 3]}
+    )
+    file_b = _write_parquet(
+        tmp_path / "b.parquet", {"k": pl.Series(keys_b, dtype=dtype), "v": [2, 30, 4]}
+    )
+
+    differ = DataDiff(key_columns=["k"])
+    differ.compare(file_a, file_b)
+    mismatches = differ.get_mismatch_df()
+
+    assert mismatches.rows() == [(pl.Series(keys_a, dtype=dtype)[2], 3, 30)]
+
+
+def test_key_overlap_filter_prunes_disjoint_ranges(tmp_path):
+    file_a = _write_parquet(tmp_path / "a.parquet", {"k": ["a", "b"], "v": [1, 2]})
+    file_b = _write_parquet(tmp_path / "b.parquet", {"k": ["x", "y"], "v": [1, 2]})
+
+    key_filter = _key_overlap_filter(file_a, file_b, {"k": pl.String})
+
+    assert pl.scan_parquet(file_a).filter(key_filter).collect().height == 0
+
+
+def test_mismatch_df_excludes_identical_pairings_of_duplicate_keys(tmp_path):
+    file_a = _write_parquet(tmp_path / "a.parquet", {"k": [1, 1], "v": [1, 2]})
+    file_b = _write_parquet(tmp_path / "b.parquet", {"k": [1], "v": [1]})
+
+    differ = DataDiff(key_columns=["k"])
+    differ.compare(file_a, file_b)
+
+    assert differ.get_mismatch_df().rows() == [(1, 2, 1)]
+
+
+def test_mismatch_df_with_decimal_keys(tmp_path):
+    keys = pl.Series([decimal.Decimal("1.10"), decimal.Decimal("2.20")], dtype=pl.Decimal(10, 2))
+    file_a = _write_parquet(tmp_path / "a.parquet", {"k": keys, "v": [1, 2]})
+    file_b = _write_parquet(tmp_path / "b.parquet", {"k": keys, "v": [1, 20]})
+
+    differ = DataDiff(key_columns=["k"])
+    differ.compare(file_a, file_b)
+
+    assert differ.get_mismatch_df().rows() == [(decimal.Decimal("2.20"), 2, 20)]
+
+
+@pytest.mark.parametrize(
+    "keys",
+    [pl.Series([[1], [2]]), pl.Series([[1], [2]], dtype=pl.Array(pl.Int64, 1))],
+    ids=["list", "array"],
+)
+def test_mismatch_df_with_nested_keys(tmp_path, keys):
+    file_a = _write_parquet(tmp_path / "a.parquet", {"k": keys, "v": [1, 2]})
+    file_b = _write_parquet(tmp_path / "b.parquet", {"k": keys, "v": [1, 20]})
+
+    differ = DataDiff(key_columns=["k"])
+    differ.compare(file_a, file_b)
+
+    assert differ.get_mismatch_df().rows() == [([2], 2, 20)]
+
+
+def test_scan_df_matches_extensions_case_insensitively(tmp_path):
+    path = _write_parquet(tmp_path / "upper.PARQUET", {"k": [1, 2]})
+
+    assert _scan_df(path).collect()["k"].to_list() == [1, 2]
+
+
+@pytest.fixture
+def pair(tmp_path):
+    # Keys 2 and 3 differ; 1 is identical, 0 and 4 are unmatched
+    file_a = _write_parquet(tmp_path / "a.parquet", {"k": [0, 1, 2, 3], "v": [0, 1, 2, 3]})
+    file_b = _write_parquet(tmp_path / "b.parquet", {"k": [1, 2, 3, 4], "v": [1, 20, 30, 4]})
+    return file_a, file_b
+
+
+def test_mismatch_df_uses_keys_returned_by_compare(monkeypatch, pair):
+    keys_ipc = io.BytesIO()
+    pl.DataFrame({"k": [3]}).write_ipc_stream(keys_ipc)
+    calls = []
+
+    def fake_diff_files(file_a, file_b, key_cols, return_mismatch_keys=False):
+        calls.append(return_mismatch_keys)
+        return {"modified_rows_count": 1, "mismatch_keys_ipc": keys_ipc.getvalue()}
+
+    monkeypatch.setattr(core, "_rust_diff_files", fake_diff_files)
+    differ = DataDiff(key_columns=["k"], keep_mismatch_keys=True)
+    result = differ.compare(*pair)
+
+    assert calls == [True]
+    assert "mismatch_keys_ipc" not in result
+    # Only the engine's keys are rebuilt, not a fresh join over the inputs
+    assert differ.get_mismatch_df().rows() == [(3, 3, 30)]
+
+
+def test_compare_skips_mismatch_keys_by_default(monkeypatch, pair):
+    calls = []
+
+    def fake_diff_files(file_a, file_b, key_cols, return_mismatch_keys=False):
+        calls.append(return_mismatch_keys)
+        return {"modified_rows_count": 2}
+
+    monkeypatch.setattr(core, "_rust_diff_files", fake_diff_files)
+    differ = DataDiff(key_columns=["k"])
+    differ.compare(*pair)
+
+    assert calls == [False]
+    # Without engine keys, get_mismatch_df finds them with its own join
+    assert differ.get_mismatch_df().sort("k").rows() == [(2, 2, 20), (3, 3, 30)]
+
+
+@pytest.mark.parametrize("keep_mismatch_keys", [False, True])
+def test_mismatch_df_unchanged_by_sorted_fast_path(monkeypatch, tmp_path, keep_mismatch_keys):
+    file_a = _write_parquet(
+        tmp_path / "a.parquet", {"k": [1, 2, 3, 5, 8], "v": [1, 2, 3, 5, 8], "w": ["x"] * 5}
+    )
+    file_b = _write_parquet(
+        tmp_path / "b.parquet", {"k": [2, 3, 4, 5, 8], "v": [2, 30, 4, 5, 80], "w": ["x"] * 5}
+    )
+    keys_ipc = io.BytesIO()
+    pl.DataFrame({"k": [3, 8]}).write_ipc_stream(keys_ipc)
+
+    def mismatches(is_sorted):
+        monkeypatch.setattr(
+            core,
+            "_rust_diff_files",
+            lambda *args, **kwargs: {"sorted": is_sorted, "mismatch_keys_ipc": keys_ipc.getvalue()},
+        )
+        differ = DataDiff(key_columns=["k"], keep_mismatch_keys=keep_mismatch_keys)
+        differ.compare(file_a, file_b)
+        return differ.get_mismatch_df()
+
+    expected = mismatches(False)
+    assert expected.rows() == [(3, 3, "x", 30, "x"), (8, 8, "x", 80, "x")]
+    assert mismatches(True).equals(expected)
+
+
+@pytest.mark.parametrize("low_memory", [False, True])
+@pytest.mark.parametrize("suffix", [".parquet", ".csv"])
+def test_mismatch_df_low_memory(tmp_path, low_memory, suffix):
+    frames = ({"k": [1, 2, 3], "v": [1, 2, 3]}, {"k": [1, 2, 3], "v": [1, 20, 3]})
+    paths = []
+    for name, frame in zip("ab", frames):
+        path = tmp_path / f"{name}{suffix}"
+        if suffix == ".csv":
+            pl.DataFrame(frame).write_csv(path)
+        else:
+            pl.DataFrame(frame).write_parquet(path)
+        paths.append(str(path))
+
+    differ = DataDiff(key_columns=["k"], low_memory=low_memory)
+    differ.compare(*paths)
+
+    assert differ.get_mismatch_df().rows() == [(2, 2, 20)]
+
+
+def test_mismatch_df_prunes_disjoint_parquet_keys(tmp_path):
+    file_a = _write_parquet(tmp_path / "a.parquet", {"k": [1, 2], "v": [1, 2]})
+    file_b = _write_parquet(tmp_path / "b.parquet", {"k": [5, 6], "v": [1, 2]})
+
+    differ = DataDiff(key_columns=["k"])
+    differ.compare(file_a, file_b)
+
+    assert differ.get_mismatch_df().height == 0
+
+
+def test_compare_many_returns_results_in_input_order(monkeypatch, pair, tmp_path):
+    def fake_diff_files(file_a, file_b, key_cols, return_mismatch_keys=False):
+        return {"files": (file_a, file_b), "keys": key_cols}
+
+    monkeypatch.setattr(core, "_rust_diff_files", fake_diff_files)
+    file_a, file_b = pair
+    pairs = [(file_a, file_b), (file_b, file_a), (tmp_path / "a.parquet", file_b)]
+
+    results = DataDiff(key_columns=["k"]).compare_many(pairs, max_workers=2)
+
+    assert [r["files"] for r in results] == [(str(a), str(b)) for a, b in pairs]
+    assert all(r["keys"] == ["k"] for r in results)
+
+
+def test_compare_many_validates_paths_before_comparing(monkeypatch, pair, tmp_path):
+    calls = []
+    monkeypatch.setattr(core, "_rust_diff_files", lambda *args, **kwargs: calls.append(args))
+    missing = str(tmp_path / "missing.parquet")
+
+    with pytest.raises(FileNotFoundError, match="missing.parquet"):
+        DataDiff(key_columns=["k"]).compare_many([pair, (pair[0], missing)])
+    assert calls == []
+
+
+def test_compare_reuses_result_until_an_input_changes(monkeypatch, pair):
+    calls = []
+
+    def fake_diff_files(file_a, file_b, key_cols, return_mismatch_keys=False):
+        calls.append((file_a, file_b))
+        return {"call": len(calls)}
+
+    monkeypatch.setattr(core, "_rust_diff_files", fake_diff_files)
+    file_a, file_b = pair
+    differ = DataDiff(key_columns=["k"])
+
+    assert differ.compare(file_a, file_b) == {"call": 1}
+    assert differ.compare(file_a, file_b) == {"call": 1}
+
+    # Same size, newer mtime
+    stat = os.stat(file_b)
+    os.utime(file_b, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert differ.compare(file_a, file_b) == {"call": 2}
+
+    # Rewritten with a different size
+    _write_parquet(file_a, {"k": [1, 2, 3, 4, 5], "v": [1, 2, 3, 4, 5]})
+    assert differ.compare(file_a, file_b) == {"call": 3}
+    assert differ.compare(file_a, file_b) == {"call": 3}
+    assert len(calls) == 3
@@ -0,0 +1,61 @@
+import pytest
+
+from koala_diff import HtmlReporter, generate_many, reporter
+
+
+def _diff_result() -> dict:
+    return {
+        "total_rows_a": 3, "total_rows_b": 3, "joined_count": 3,
+        "identical_rows_count": 2, "modified_rows_count": 1, "added": 0, "removed": 0,
+        "column_stats": {
+            "k": {"is_key": True, "source_dtype": "Int64", "target_dtype": "Int64",
+                  "match_rate": 100.0, "non_match_count": 0, "all_match": True},
+            "v<x>": {"source_dtype": "Int64", "target_dtype": "Int64",
+                     "match_rate": 66.7, "non_match_count": 1, "all_match": False,
+                     "mismatched_sample_keys": ["k: 2"],
+                     "mismatched_value_samples": [("2", "<20>")]},
+        },
+    }
+
+
+def test_generate_writes_escaped_report(tmp_path):
+    output = tmp_path / "report.html"
+
+    HtmlReporter(str(output)).generate(_diff_result(), title="A & <B>")
+
+    html = output.read_text(encoding="utf-8")
+    assert html.startswith("<!DOCTYPE html>")
+    assert "<title>A &amp; &lt;B&gt;</title>" in html
+    assert "<code>v&lt;x&gt;</code>" in html
+    assert "&lt;20&gt;" in html
+    assert html.rstrip().endswith("</html>")
+
+
+def test_generate_many_after_generate_in_same_process(tmp_path):
+    # Worker processes may be forked from a parent that has already rendered
+    HtmlReporter(str(tmp_path / "first.html")).generate(_diff_result())
+    outputs = [str(tmp_path / f"report_{i}.html") for i in range(3)]
+
+    written = generate_many(
+        [(_diff_result(), f"Report {i}", path) for i, path in enumerate(outputs)],
+        max_workers=2,
+    )
+
+    assert written == outputs
+    for i, path in enumerate(outputs):
+        with open(path, encoding="utf-8") as f:
+            assert f"<title>Report {i}</title>" in f.read()
+
+
+def test_generate_many_empty():
+    assert generate_many([]) == []
+
+
+@pytest.mark.parametrize("error", [OSError("read-only"), RuntimeError("unsafe")])
+def test_bytecode_cache_falls_back_to_none(monkeypatch, error):
+    def unavailable(*args, **kwargs):
+        raise error
+
+    monkeypatch.setattr(reporter, "FileSystemBytecodeCache", unavailable)
+
+    assert reporter._make_bytecode_cache() is None